@@ -24,7 +24,6 @@ http://www.gnu.org/licenses/.
 
 # pylint: disable=unused-variable
 
-import collections
 import dataclasses
 import typing
 
@@ -32,13 +31,8 @@ from ... import core
 
 if not typing.TYPE_CHECKING:
 
-    @typing.overload
     class MediaSourceComponent:
-        def items(self) -> collections.abc.Iterable[core.MediaSource]:
-            pass
-
-        def get_item(self, domain: str) -> core.MediaSource:
-            pass
+        ...
 
 
 if typing.TYPE_CHECKING:
@@ -91,9 +91,10 @@ _COMP_DECORATORS: typing.Final = {
 }
 
 
-@typing.overload
-class AstEval:
-    pass
+if not typing.TYPE_CHECKING:
+
+    class AstEval:
+        ...
 
 
 def _ast_eval_exec_factory(ast_ctx: AstEval, mode: ParseMode):
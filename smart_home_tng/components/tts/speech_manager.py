@@ -130,7 +130,7 @@ class SpeechManager:
             provider._name = engine
         self._providers[engine] = provider
 
-        self.controller.config._components.add(
+        self.controller.config.component_loaded(
             core.Const.PLATFORM_FORMAT.format(
                 domain=engine, platform=self._owner.domain
             )
@@ -26,6 +26,8 @@ http://www.gnu.org/licenses/.
 class ApiConfig:  # pylint: disable=unused-variable
     """Configuration settings for API server."""
 
+    __slots__ = ("_local_ip", "_host", "_port", "_use_ssl")
+
     def __init__(
         self,
         local_ip: str,
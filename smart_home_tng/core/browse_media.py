@@ -29,12 +29,26 @@ from .media_player import MediaPlayer
 
 _BrowseMediaT = typing.TypeVar("_BrowseMediaT", bound="BrowseMedia")
 _BrowseMediaSourceT = typing.TypeVar("_BrowseMediaSourceT", bound="BrowseMediaSource")
+_MEDIA_SOURCE_URI_SCHEME: typing.Final = Const.MEDIA_SOURCE_URI_SCHEME
 
 
 # pylint: disable=unused-variable
 class BrowseMedia:
     """Represent a browsable media file."""
 
+    __slots__ = (
+        "_media_class",
+        "_media_content_id",
+        "_media_content_type",
+        "_title",
+        "_can_play",
+        "_can_expand",
+        "_children",
+        "_children_media_class",
+        "_thumbnail",
+        "_not_shown",
+    )
+
     def __init__(
         self,
         *,
@@ -165,11 +179,14 @@ class BrowseMedia:
 class BrowseMediaSource(BrowseMedia):
     """Represent a browsable media file."""
 
+    __slots__ = ("_domain", "_identifier")
+
     def __init__(self, *, domain: str, identifier: str, **kwargs: typing.Any) -> None:
         """Initialize media source browse media."""
-        media_content_id = f"{Const.MEDIA_SOURCE_URI_SCHEME}{domain or ''}"
         if identifier:
-            media_content_id += f"/{identifier}"
+            media_content_id = f"{_MEDIA_SOURCE_URI_SCHEME}{domain or ''}/{identifier}"
+        else:
+            media_content_id = f"{_MEDIA_SOURCE_URI_SCHEME}{domain or ''}"
 
         super().__init__(media_content_id=media_content_id, **kwargs)
 
@@ -47,14 +47,19 @@ class ColorTempSelector(Selector):
     def __init__(self, config: ColorTempSelectorConfig = None) -> None:
         """Instantiate a selector."""
         super().__init__("color_temp", config)
+        self._min_mireds: int = self._config.get("min_mireds")
+        self._max_mireds: int = self._config.get("max_mireds")
 
-    def __call__(self, data: typing.Any) -> int:
+    def __call__(self, data: typing.Any) -> float:
         """Validate the passed selection."""
-        value: int = vol.All(
-            vol.Coerce(float),
-            vol.Range(
-                min=self._config.get("min_mireds"),
-                max=self._config.get("max_mireds"),
-            ),
-        )(data)
+        try:
+            value: float = float(data)
+        except (TypeError, ValueError) as err:
+            raise vol.CoerceInvalid("expected float") from err
+
+        # Negated comparisons like vol.Range, so NaN fails a configured bound
+        if self._min_mireds is not None and not value >= self._min_mireds:
+            raise vol.RangeInvalid(f"value must be at least {self._min_mireds}")
+        if self._max_mireds is not None and not value <= self._max_mireds:
+            raise vol.RangeInvalid(f"value must be at most {self._max_mireds}")
         return value
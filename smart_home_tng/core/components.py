@@ -22,6 +22,7 @@ License along with this program.  If not, see
 http://www.gnu.org/licenses/.
 """
 
+import sys
 import typing
 
 from .integration import Integration
@@ -49,6 +50,8 @@ class Components:
 
     def __getattr__(self, comp_name: str) -> SmartHomeControllerComponent:
         """Fetch a component."""
+        # Share one string object between the cache and the instance dict
+        comp_name = sys.intern(comp_name)
         # Test integration cache
         integration = self._data.get(comp_name)
         if integration is None:
@@ -29,7 +29,6 @@ import pathlib
 import typing
 
 import yarl
-from urllib3.util import url
 
 from . import helpers
 from .api_config import ApiConfig
@@ -39,10 +38,13 @@ from .const import Const
 from .location_info import LocationInfo
 from .smart_home_controller_error import SmartHomeControllerError
 from .store import Store
+from .unit_conversion import DistanceConverter
 from .unit_system import UnitSystem
 
 _CORE_STORAGE_KEY = "core.config"
 _CORE_STORAGE_VERSION = 1
+_CORE_STORAGE_SAVE_DELAY: typing.Final = 0.5
+_VERSION: typing.Final = Const.__version__
 
 _LOGGER: typing.Final = logging.getLogger(__name__)
 
@@ -57,6 +59,11 @@ if typing.TYPE_CHECKING:
     from .smart_home_controller import SmartHomeController
 
 
+def _has_path(url_to_check: str) -> bool:
+    """Check if a stored url contains a path."""
+    return bool(url_to_check) and yarl.URL(url_to_check).path not in ("", "/")
+
+
 # pylint: disable=unused-variable
 class Config:
     """Configuration settings for Smart Home - The Next Generation."""
@@ -70,6 +77,8 @@ class Config:
         self._location_name: str = "Home"
         self._time_zone: str = "UTC"
         self._units: UnitSystem = UnitSystem.METRIC()
+        self._units_as_dict: dict[str, str] = None
+        self._meters_to_length: float = None
         self._internal_url: str = None
         self._external_url: str = None
         self._currency: str = "EUR"
@@ -81,6 +90,7 @@ class Config:
 
         # List of loaded components
         self._components: set[str] = set()
+        self._components_snapshot: frozenset[str] = frozenset()
 
         # API (HTTP) server configuration
         self._api: ApiConfig = None
@@ -89,10 +99,12 @@ class Config:
         self._config_dir: str = None
 
         # List of allowed external dirs to access
-        self._allowlist_external_dirs: set[str] = set()
+        self._allowlist_external_dirs: frozenset[str] = frozenset()
+        self._allowlist_external_dir_prefixes: tuple[str, ...] = ()
 
         # List of allowed external URLs that integrations may use
-        self._allowlist_external_urls: set[str] = set()
+        self._allowlist_external_urls: frozenset[str] = frozenset()
+        self._allowlist_external_url_prefixes: tuple[str, ...] = ()
 
         # Dictionary of Media folders that integrations may use
         self._media_dirs: dict[str, str] = {}
@@ -106,6 +118,14 @@ class Config:
         # Error Log Path
         self._error_log_path: str = None
 
+        self._store = Store[dict[str, typing.Any]](
+            shc,
+            _CORE_STORAGE_VERSION,
+            _CORE_STORAGE_KEY,
+            private=True,
+            atomic_writes=True,
+        )
+
     @property
     def api(self) -> ApiConfig:
         return self._api
@@ -170,6 +190,8 @@ class Config:
     @units.setter
     def units(self, units: UnitSystem) -> None:
         self._units = units
+        self._units_as_dict = None
+        self._meters_to_length = None
 
     @property
     def internal_url(self) -> str:
@@ -216,11 +238,15 @@ class Config:
         self._skip_pip = skip_pip
 
     @property
-    def components(self) -> set:
-        return frozenset(self._components)
+    def components(self) -> frozenset[str]:
+        if self._components_snapshot is None:
+            self._components_snapshot = frozenset(self._components)
+        return self._components_snapshot
 
     def component_loaded(self, component: str) -> None:
-        self._components.add(component)
+        if component not in self._components:
+            self._components.add(component)
+            self._components_snapshot = None
 
     @property
     def allowlist_external_dirs(self) -> collections.abc.Iterable[str]:
@@ -231,10 +257,12 @@ class Config:
         self, allow_list_external_dirs: collections.abc.Iterable[str]
     ) -> None:
         if allow_list_external_dirs is not None:
-            self._allowlist_external_dirs = set()
-            for allowed in allow_list_external_dirs:
-                if allowed not in self._allowlist_external_dirs:
-                    self._allowlist_external_dirs.add(allowed)
+            self._allowlist_external_dirs = frozenset(allow_list_external_dirs)
+            # Normalized once, so is_allowed_path only needs a string compare
+            self._allowlist_external_dir_prefixes = tuple(
+                os.path.join(os.path.normpath(allowed), "")
+                for allowed in self._allowlist_external_dirs
+            )
 
     @property
     def allowlist_external_urls(self) -> collections.abc.Iterable[str]:
@@ -243,10 +271,8 @@ class Config:
     @allowlist_external_urls.setter
     def allowlist_external_urls(self, allowlist: collections.abc.Iterable[str]) -> None:
         if allowlist is not None:
-            self._allowlist_external_urls = set()
-            for allowed in self._allowlist_external_urls:
-                if allowed not in self._allowlist_external_urls:
-                    self._allowlist_external_urls.add(allowed)
+            self._allowlist_external_urls = frozenset(allowlist)
+            self._allowlist_external_url_prefixes = tuple(self._allowlist_external_urls)
 
     @property
     def media_dirs(self) -> collections.abc.Iterable[str, str]:
@@ -289,29 +315,30 @@ class Config:
 
         Async friendly.
         """
-        return self._units.length(
-            LocationInfo.distance(self._latitude, self._longitude, lat, lon),
-            Const.LENGTH_METERS,
-        )
+        meters = LocationInfo.distance(self._latitude, self._longitude, lat, lon)
+        if meters is None:
+            # Let the unit system report the invalid value
+            return self._units.length(meters, Const.LENGTH_METERS)
+        if self._meters_to_length is None:
+            self._meters_to_length = DistanceConverter.get_unit_ratio(
+                self._units.length_unit, Const.LENGTH_METERS
+            )
+        return meters * self._meters_to_length
 
     def path(self, *path: str) -> str:
         """Generate path to the file within the configuration directory.
 
         Async friendly.
         """
-        if self._config_dir is None:
+        if (config_dir := self._config_dir) is None:
             raise SmartHomeControllerError("config_dir is not set")
-        return os.path.join(self._config_dir, *path)
+        return os.path.join(config_dir, *path)
 
     def is_allowed_external_url(self, url_to_check: str) -> bool:
         """Check if an external URL is allowed."""
         parsed_url = f"{str(yarl.URL(url_to_check))}/"
 
-        return any(
-            allowed
-            for allowed in self._allowlist_external_urls
-            if parsed_url.startswith(allowed)
-        )
+        return parsed_url.startswith(self._allowlist_external_url_prefixes)
 
     def is_allowed_path(self, path: str) -> bool:
         """Check if the path is valid for access from outside."""
@@ -327,34 +354,34 @@ class Config:
         except (FileNotFoundError, RuntimeError, PermissionError):
             return False
 
-        for allowed_path in self._allowlist_external_dirs:
-            try:
-                thepath.relative_to(allowed_path)
-                return True
-            except ValueError:
-                pass
-
-        return False
+        # Symlinks must stay resolved above, otherwise they could be used to
+        # escape the allowed directories.
+        return os.path.join(str(thepath), "").startswith(
+            self._allowlist_external_dir_prefixes
+        )
 
     def as_dict(self) -> dict[str, typing.Any]:
         """Create a dictionary representation of the configuration.
 
         Async friendly.
         """
+        # Hand out a copy, so callers can't change the cached unit system
+        if self._units_as_dict is None:
+            self._units_as_dict = self._units.as_dict()
         return {
             Const.CONF_LATITUDE: self._latitude,
             Const.CONF_LONGITUDE: self._longitude,
             Const.CONF_ELEVATION: self._elevation,
-            Const.CONF_UNIT_SYSTEM: self._units.as_dict(),
+            Const.CONF_UNIT_SYSTEM: dict(self._units_as_dict),
             Const.CONF_LOCATION_NAME: self._location_name,
             Const.CONF_TIME_ZONE: self._time_zone,
-            Const.CONF_COMPONENTS: self._components,
+            Const.CONF_COMPONENTS: self.components,
             Const.CONF_CONFIG_DIR: self._config_dir,
             # legacy, backwards compat
             Const.LEGACY_CONF_WHITELIST_EXTERNAL_DIRS: self._allowlist_external_dirs,
             Const.CONF_ALLOWLIST_EXTERNAL_DIRS: self._allowlist_external_dirs,
             Const.CONF_ALLOWLIST_EXTERNAL_URLS: self._allowlist_external_urls,
-            Const.CONF_VERSION: Const.__version__,
+            Const.CONF_VERSION: _VERSION,
             Const.CONF_CONFIG_SOURCE: self._config_source,
             Const.CONF_SAFE_MODE: self._safe_mode,
             Const.CONF_STATE: self._shc.state.value,
@@ -396,55 +423,37 @@ class Config:
             self._elevation = elevation
         if unit_system is not None:
             if unit_system == Const.CONF_UNIT_SYSTEM_IMPERIAL:
-                self._units = UnitSystem.IMPERIAL()
+                self.units = UnitSystem.IMPERIAL()
             else:
-                self._units = UnitSystem.METRIC()
+                self.units = UnitSystem.METRIC()
         if location_name is not None:
             self._location_name = location_name
         if time_zone is not None:
             self.set_time_zone(time_zone)
         if external_url is not None:
-            self._external_url = typing.cast(typing.Optional[str], external_url)
+            self._external_url = external_url
         if internal_url is not None:
-            self._internal_url = typing.cast(typing.Optional[str], internal_url)
+            self._internal_url = internal_url
         if currency is not None:
             self._currency = currency
 
     async def async_update(self, **kwargs: typing.Any) -> None:
         """Update the configuration from a dictionary."""
         self._update(source=ConfigSource.STORAGE, **kwargs)
-        await self.async_store()
+        self._store.async_delay_save(self._data_to_save, _CORE_STORAGE_SAVE_DELAY)
         self._shc.bus.async_fire(Const.EVENT_CORE_CONFIG_UPDATE, kwargs)
 
     async def async_load(self) -> None:
         """Load [TheNextGeneration] core config."""
-        store = Store[dict[str, typing.Any]](
-            self._shc,
-            _CORE_STORAGE_VERSION,
-            _CORE_STORAGE_KEY,
-            private=True,
-            atomic_writes=True,
-        )
-
-        if not (data := await store.async_load()):
+        if not (data := await self._store.async_load()):
             return
 
         # In 2021.9 we fixed validation to disallow a path (because that's never correct)
         # but this data still lives in storage, so we print a warning.
-        if data.get("external_url") and url.parse_url(
-            data["external_url"]
-        ).path not in (
-            "",
-            "/",
-        ):
+        if _has_path(data.get("external_url")):
             _LOGGER.warning("Invalid external_url set. It's not allowed to have a path")
 
-        if data.get("internal_url") and url.parse_url(
-            data["internal_url"]
-        ).path not in (
-            "",
-            "/",
-        ):
+        if _has_path(data.get("internal_url")):
             _LOGGER.warning("Invalid internal_url set. It's not allowed to have a path")
 
         self._update(
@@ -462,7 +471,12 @@ class Config:
 
     async def async_store(self) -> None:
         """Store [TheNextGeneration] core config."""
-        data = {
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, typing.Any]:
+        """Return data of core config to store in a file."""
+        return {
             "latitude": self._latitude,
             "longitude": self._longitude,
             "elevation": self._elevation,
@@ -473,12 +487,3 @@ class Config:
             "internal_url": self._internal_url,
             "currency": self._currency,
         }
-
-        store = Store[dict[str, typing.Any]](
-            self._shc,
-            _CORE_STORAGE_VERSION,
-            _CORE_STORAGE_KEY,
-            private=True,
-            atomic_writes=True,
-        )
-        await store.async_save(data)
@@ -83,6 +83,7 @@ class ConfigEntries:
         self._config = config
         self._entries: dict[str, ConfigEntry] = {}
         self._domain_index: dict[str, list[str]] = {}
+        self._unique_id_index: dict[tuple[str, str], str] = {}
         self._store = Store[dict[str, list[dict[str, typing.Any]]]](
             shc, _STORAGE_VERSION, _STORAGE_KEY
         )
@@ -124,6 +125,32 @@ class ConfigEntries:
             self._entries[entry_id] for entry_id in self._domain_index.get(domain, [])
         ]
 
+    @callback
+    def async_entry_for_unique_id(self, domain: str, unique_id: str) -> ConfigEntry:
+        """Return the entry of a domain with matching unique_id."""
+        if (entry_id := self._unique_id_index.get((domain, unique_id))) is None:
+            return None
+        return self._entries[entry_id]
+
+    @callback
+    def _async_index_unique_id(self, entry: ConfigEntry) -> None:
+        """Add an entry to the unique id index."""
+        key = (entry.domain, entry.unique_id)
+        self._unique_id_index.setdefault(key, entry.entry_id)
+
+    @callback
+    def _async_unindex_unique_id(self, entry: ConfigEntry) -> None:
+        """Remove an entry from the unique id index."""
+        key = (entry.domain, entry.unique_id)
+        if self._unique_id_index.get(key) != entry.entry_id:
+            return
+        del self._unique_id_index[key]
+        # Another entry of the domain may share the unique id
+        for other in self.async_entries(entry.domain):
+            if other.entry_id != entry.entry_id and other.unique_id == entry.unique_id:
+                self._unique_id_index[key] = other.entry_id
+                break
+
     @callback
     def _dispatch_entry_changed(
         self, change: ConfigEntryChange, entry: ConfigEntry
@@ -140,6 +167,7 @@ class ConfigEntries:
             )
         self._entries[entry.entry_id] = entry
         self._domain_index.setdefault(entry.domain, []).append(entry.entry_id)
+        self._async_index_unique_id(entry)
         self._dispatch_entry_changed(ConfigEntryChange.ADDED, entry)
         await self.async_setup(entry.entry_id)
         self._async_schedule_save()
@@ -160,6 +188,7 @@ class ConfigEntries:
         self._domain_index[entry.domain].remove(entry.entry_id)
         if not self._domain_index[entry.domain]:
             del self._domain_index[entry.domain]
+        self._async_unindex_unique_id(entry)
         self._async_schedule_save()
 
         dev_reg = self._shc.device_registry
@@ -219,10 +248,12 @@ class ConfigEntries:
         if config is None:
             self._entries = {}
             self._domain_index = {}
+            self._unique_id_index = {}
             return
 
         entries = {}
         domain_index: dict[str, list[str]] = {}
+        unique_id_index: dict[tuple[str, str], str] = {}
 
         for entry in config["entries"]:
             pref_disable_new_entities = entry.get("pref_disable_new_entities")
@@ -257,8 +288,10 @@ class ConfigEntries:
                 pref_disable_polling=entry.get("pref_disable_polling"),
             )
             domain_index.setdefault(domain, []).append(entry_id)
+            unique_id_index.setdefault((domain, entry.get("unique_id")), entry_id)
 
         self._domain_index = domain_index
+        self._unique_id_index = unique_id_index
         self._entries = entries
 
     async def async_setup(self, entry_id: str) -> bool:
@@ -380,8 +413,14 @@ class ConfigEntries:
         """
         changed = False
 
+        if unique_id is not _UNDEFINED and entry.unique_id != unique_id:
+            self._async_unindex_unique_id(entry)
+            # pylint: disable=protected-access
+            entry._unique_id = unique_id
+            self._async_index_unique_id(entry)
+            changed = True
+
         for attr, value in (
-            ("_unique_id", unique_id),
             ("_title", title),
             ("_pref_disable_new_entities", pref_disable_new_entities),
             ("_pref_disable_polling", pref_disable_polling),
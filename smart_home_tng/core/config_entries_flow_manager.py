@@ -22,6 +22,7 @@ License along with this program.  If not, see
 http://www.gnu.org/licenses/.
 """
 
+import asyncio
 import logging
 import typing
 
@@ -57,19 +58,34 @@ if typing.TYPE_CHECKING:
     from .smart_home_controller import SmartHomeController
 
 
-_DISCOVERY_SOURCES: typing.Final = (
-    ConfigEntrySource.DHCP,
-    ConfigEntrySource.DISCOVERY,
-    ConfigEntrySource.HOMEKIT,
-    ConfigEntrySource.IMPORT,
-    ConfigEntrySource.INTEGRATION_DISCOVERY,
-    ConfigEntrySource.MQTT,
-    ConfigEntrySource.SSDP,
-    ConfigEntrySource.UNIGNORE,
-    ConfigEntrySource.USB,
-    ConfigEntrySource.ZEROCONF,
+_DISCOVERY_SOURCES: typing.Final = frozenset(
+    {
+        ConfigEntrySource.DHCP,
+        ConfigEntrySource.DISCOVERY,
+        ConfigEntrySource.HOMEKIT,
+        ConfigEntrySource.IMPORT,
+        ConfigEntrySource.INTEGRATION_DISCOVERY,
+        ConfigEntrySource.MQTT,
+        ConfigEntrySource.SSDP,
+        ConfigEntrySource.UNIGNORE,
+        ConfigEntrySource.USB,
+        ConfigEntrySource.ZEROCONF,
+    }
 )
 
+_DISCOVERY_NOTIFICATION_DELAY: typing.Final = 0.05
+_DISCOVERY_NOTIFICATION_MESSAGE: typing.Final = (
+    "Wir haben neue Geräte in deinem Netzwerk entdeckt. "
+    + "[Überprüfen](/config/integrations)."
+)
+_DISCOVERY_NOTIFICATION_TITLE: typing.Final = "Neue Geräte entdeckt"
+_REAUTH_NOTIFICATION_MESSAGE: typing.Final = (
+    "Mindestens eine deiner Integrationen muss neu konfiguriert "
+    + "werden, um weiter zu funktionieren. "
+    + "[Überprüfen](/config/integrations)."
+)
+_REAUTH_NOTIFICATION_TITLE: typing.Final = "Integration erfordert Rekonfiguration"
+
 _LOGGER: typing.Final = logging.getLogger(__name__)
 
 
@@ -87,21 +103,32 @@ class ConfigEntriesFlowManager(FlowManager):
         super().__init__(shc)
         self._config_entries = config_entries
         self._config = config
+        self._discovery_flow_ids: set[str] = set()
+        self._flow_platforms: dict[str, ConfigFlowPlatform] = {}
+        self._discovery_notification: asyncio.TimerHandle = None
+
+    @callback
+    def _async_add_flow_progress(self, flow: FlowHandler) -> None:
+        """Add a flow to in progress and track discovery flows."""
+        super()._async_add_flow_progress(flow)
+        if flow.context["source"] in _DISCOVERY_SOURCES:
+            self._discovery_flow_ids.add(flow.flow_id)
+
+    @callback
+    def _async_remove_flow_progress(self, flow_id: str) -> None:
+        """Remove a flow from in progress and the discovery flows."""
+        super()._async_remove_flow_progress(flow_id)
+        self._discovery_flow_ids.discard(flow_id)
 
     @callback
     def _async_has_other_discovery_flows(self, flow_id: str) -> bool:
         """Check if there are any other discovery flows in progress."""
-        return any(
-            flow.context["source"] in _DISCOVERY_SOURCES and flow.flow_id != flow_id
-            for flow in self._progress.values()
-        )
+        return len(self._discovery_flow_ids) > (flow_id in self._discovery_flow_ids)
 
-    async def async_finish_flow(
-        self, flow: FlowHandler, result: FlowResult
+    async def async_finish_flow(  # type: ignore[override]
+        self, flow: ConfigFlow, result: FlowResult
     ) -> FlowResult:
         """Finish a config flow and add an entry."""
-        flow = typing.cast(ConfigFlow, flow)
-
         # Remove notification if no other discovery config entries in progress
         if not self._async_has_other_discovery_flows(flow.flow_id):
             comp = SmartHomeControllerComponent.get_component(
@@ -117,14 +144,21 @@ class ConfigEntriesFlowManager(FlowManager):
         existing_entry = None
 
         # Abort all flows in progress with same unique ID
-        # or the default discovery ID
-        for progress_flow in self.async_progress_by_handler(flow.handler):
-            progress_unique_id = progress_flow["context"].get("unique_id")
-            if progress_flow["flow_id"] != flow.flow_id and (
-                (flow.unique_id and progress_unique_id == flow.unique_id)
-                or progress_unique_id == ConfigFlow.DEFAULT_DISCOVERY_UNIQUE_ID
-            ):
-                self.async_abort(progress_flow["flow_id"])
+        # or the default discovery ID. Nothing to do, if the
+        # finishing flow is the only one of its handler.
+        if len(self._handler_progress_index.get(flow.handler, ())) > 1:
+            flow_id = flow.flow_id
+            unique_id = flow.unique_id
+            default_unique_id = ConfigFlow.DEFAULT_DISCOVERY_UNIQUE_ID
+            # The list is a snapshot, so aborting while iterating is safe
+            for progress_flow in self._async_progress_by_handler(flow.handler):
+                if progress_flow.flow_id == flow_id or progress_flow.cur_step is None:
+                    continue
+                progress_unique_id = progress_flow.context.get("unique_id")
+                if (
+                    unique_id and progress_unique_id == unique_id
+                ) or progress_unique_id == default_unique_id:
+                    self.async_abort(progress_flow.flow_id)
 
         if flow.unique_id is not None:
             # Reset unique ID when the default discovery ID has been used
@@ -132,10 +166,9 @@ class ConfigEntriesFlowManager(FlowManager):
                 await flow.async_set_unique_id(None)
 
             # Find existing entry.
-            for check_entry in self._config_entries.async_entries(result["handler"]):
-                if check_entry.unique_id == flow.unique_id:
-                    existing_entry = check_entry
-                    break
+            existing_entry = self._config_entries.async_entry_for_unique_id(
+                result["handler"], flow.unique_id
+            )
 
         # Unload the entry before setting up the new one.
         # We will remove it only after the other one is set up,
@@ -172,10 +205,23 @@ class ConfigEntriesFlowManager(FlowManager):
 
         Handler key is the domain of the component that we want to set up.
         """
+        if (platform := self._flow_platforms.get(handler_key)) is None:
+            platform = await self._async_resolve_flow_platform(handler_key)
+            self._flow_platforms[handler_key] = platform
+
+        if not context or "source" not in context:
+            raise KeyError("Context not set or doesn't have a source set")
+
+        return platform.create_config_flow(context, data)
+
+    async def _async_resolve_flow_platform(
+        self, handler_key: str
+    ) -> ConfigFlowPlatform:
+        """Load the integration of a handler and return its config flow platform."""
         try:
             integration = await self._shc.setup.async_get_integration(handler_key)
         except IntegrationNotFound as err:
-            _LOGGER.error(f"Cannot find integration {handler_key}")
+            _LOGGER.error("Cannot find integration %s", handler_key)
             raise UnknownHandler from err
 
         # Make sure requirements and dependencies of component are resolved
@@ -192,37 +238,53 @@ class ConfigEntriesFlowManager(FlowManager):
                     platform = None
         if platform is None:
             raise UnknownHandler
+        return platform
 
-        if not context or "source" not in context:
-            raise KeyError("Context not set or doesn't have a source set")
+    async def async_shutdown(self) -> None:
+        """Cancel any initializing flows and pending notifications."""
+        if self._discovery_notification is not None:
+            self._discovery_notification.cancel()
+            self._discovery_notification = None
+        await super().async_shutdown()
 
-        return platform.create_config_flow(context, data)
+    @callback
+    def _async_notify_discovery(self) -> None:
+        """Announce the discovery flows started since the last announcement."""
+        self._discovery_notification = None
+        # All of them might have finished already, which also
+        # dismissed the notification.
+        if not self._discovery_flow_ids:
+            return
+
+        self._shc.bus.async_fire(ConfigEntry.EVENT_FLOW_DISCOVERED)
+        comp = SmartHomeControllerComponent.get_component(
+            Const.PERSISTENT_NOTIFICATION_COMPONENT_NAME
+        )
+        if isinstance(comp, PersistentNotificationComponent):
+            comp.async_create(
+                _DISCOVERY_NOTIFICATION_MESSAGE,
+                _DISCOVERY_NOTIFICATION_TITLE,
+                ConfigEntry.DISCOVERY_NOTIFICATION_ID,
+            )
 
     async def async_post_init(self, flow: FlowHandler, result: FlowResult) -> None:
         """After a flow is initialised trigger new flow notifications."""
         source = flow.context["source"]
-        comp = SmartHomeControllerComponent.get_component(
-            Const.PERSISTENT_NOTIFICATION_COMPONENT_NAME
-        )
-        if not isinstance(comp, PersistentNotificationComponent):
-            comp = None
 
         # Create notification.
         if source in _DISCOVERY_SOURCES:
-            self._shc.bus.async_fire(ConfigEntry.EVENT_FLOW_DISCOVERED)
-            if comp is not None:
-                comp.async_create(
-                    "Wir haben neue Geräte in deinem Netzwerk entdeckt. "
-                    + "[Überprüfen](/config/integrations).",
-                    "Neue Geräte entdeckt",
-                    ConfigEntry.DISCOVERY_NOTIFICATION_ID,
+            # Bursts of discovered flows share one event and notification
+            if self._discovery_notification is None:
+                self._discovery_notification = self._shc.call_later(
+                    _DISCOVERY_NOTIFICATION_DELAY, self._async_notify_discovery
                 )
         elif source == ConfigEntrySource.REAUTH:
-            if comp is not None:
+            comp = SmartHomeControllerComponent.get_component(
+                Const.PERSISTENT_NOTIFICATION_COMPONENT_NAME
+            )
+            if isinstance(comp, PersistentNotificationComponent):
                 comp.async_create(
-                    "Mindestens eine deiner Integrationen muss neu konfiguriert "
-                    + "werden, um weiter zu funktionieren. "
-                    + "[Überprüfen](/config/integrations).",
-                    "Integration erfordert Rekonfiguration",
+                    _REAUTH_NOTIFICATION_MESSAGE,
+                    _REAUTH_NOTIFICATION_TITLE,
                     Const.CONFIG_ENTRY_RECONFIGURE_NOTIFICATION_ID,
                 )
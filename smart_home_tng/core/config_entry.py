@@ -373,8 +373,12 @@ class ConfigEntry:
                 )
             else:
                 _LOGGER.debug(
-                    f"Config entry '{self._title}' for {self._domain} integration not "
-                    + f"{ready_message}; Retrying in {wait_time} seconds"
+                    "Config entry '%s' for %s integration not %s; "
+                    "Retrying in %s seconds",
+                    self._title,
+                    self._domain,
+                    ready_message,
+                    wait_time,
                 )
 
             async def setup_again(*_: typing.Any) -> None:
@@ -30,6 +30,8 @@ from .device_base import DeviceBase
 class DeletedDevice(DeviceBase):
     """Base class for device, will be used for deleted devices."""
 
+    __slots__ = ("_orphaned_timestamp",)
+
     def __init__(
         self,
         device_id: str,
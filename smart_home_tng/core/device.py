@@ -32,6 +32,23 @@ from .device_registry_entry_type import DeviceRegistryEntryType
 class Device(DeviceBase):
     """Device Registry Entry."""
 
+    __slots__ = (
+        "_area_id",
+        "_configuration_url",
+        "_disabled_by",
+        "_entry_type",
+        "_manufacturer",
+        "_model",
+        "_name_by_user",
+        "_name",
+        "_suggested_area",
+        "_sw_version",
+        "_hw_version",
+        "_via_device_id",
+        "_is_new",
+        "_disabled",
+    )
+
     def __init__(
         self,
         device_id: str = None,
@@ -61,19 +78,20 @@ class Device(DeviceBase):
             identitifiers=identifiers,
         )
         self._area_id = area_id
-        self._configuration_url = configuration_url
+        self._configuration_url = helpers.intern_str(configuration_url)
         self._disabled_by = disabled_by
         self._entry_type = entry_type
-        self._manufacturer = manufacturer
-        self._model = model
+        self._manufacturer = helpers.intern_str(manufacturer)
+        self._model = helpers.intern_str(model)
         self._name_by_user = name_by_user
         self._name = name
         self._suggested_area = suggested_area
-        self._sw_version = sw_version
-        self._hw_version = hw_version
+        self._sw_version = helpers.intern_str(sw_version)
+        self._hw_version = helpers.intern_str(hw_version)
         self._via_device_id = via_device_id
         # This value is not stored, just used to keep track of events to fire.
         self._is_new = is_new
+        self._disabled = disabled_by is not None
 
     @property
     def area_id(self) -> str:
@@ -130,4 +148,4 @@ class Device(DeviceBase):
     @property
     def disabled(self) -> bool:
         """Return if entry is disabled."""
-        return self.disabled_by is not None
+        return self._disabled
@@ -30,6 +30,8 @@ class DeviceBase:
     and device registry entries.
     """
 
+    __slots__ = ("_id", "_config_entries", "_connections", "_identifiers")
+
     def __init__(
         self,
         device_id: str,
@@ -44,15 +44,19 @@ class DeviceSelector(Selector):
         """Instantiate a selector."""
         selector_type = "device"
         super().__init__(selector_type, config)
+        self._multiple: bool = self._config["multiple"]
 
     def __call__(self, data: typing.Any) -> str | list[str]:
         """Validate the passed selection."""
-        if not self._config["multiple"]:
-            device_id: str = vol.Schema(str)(data)
-            return device_id
+        if not self._multiple:
+            if not isinstance(data, str):
+                raise vol.Invalid("expected str")
+            return data
         if not isinstance(data, list):
             raise vol.Invalid("Value should be a list")
-        return [vol.Schema(str)(val) for val in data]
+        if not all(isinstance(val, str) for val in data):
+            raise vol.Invalid("expected str")
+        return data
 
     def config_schema(self, config: typing.Any) -> typing.Any:
         return _CONFIG_SCHEMA(config)
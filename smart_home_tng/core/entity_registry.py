@@ -23,10 +23,10 @@ http://www.gnu.org/licenses/.
 """
 
 import collections.abc
+import contextlib
 import logging
 import typing
 
-import attr
 import voluptuous as vol
 
 from . import helpers
@@ -35,7 +35,7 @@ from .config_entry import ConfigEntry
 from .const import Const
 from .device_registry_entry_disabler import DeviceRegistryEntryDisabler
 from .entity_category import EntityCategory
-from .entity_registry_entry import EntityRegistryEntry
+from .entity_registry_entry import _FIELDS, _FIELDS_GETTER, EntityRegistryEntry
 from .entity_registry_entry_disabler import EntityRegistryEntryDisabler
 from .entity_registry_entry_hider import EntityRegistryEntryHider
 from .entity_registry_items import EntityRegistryItems
@@ -56,7 +56,6 @@ if typing.TYPE_CHECKING:
     from .smart_home_controller import SmartHomeController
 
 
-_T = typing.TypeVar("_T")
 _STORAGE_VERSION_MAJOR: typing.Final = 1
 _STORAGE_VERSION_MINOR: typing.Final = 6
 _STORAGE_KEY: typing.Final = "core.entity_registry"
@@ -64,6 +63,30 @@ _LOGGER: typing.Final = logging.getLogger(__name__)
 _PATH_REGISTRY: typing.Final = "entity_registry.yaml"
 _SAVE_DELAY: typing.Final = 10
 _UNDEFINED: typing.Final = object()
+# The stored fields are exactly the constructor arguments of an entry
+_SAVED_FIELDS: typing.Final = _FIELDS
+_SAVED_FIELDS_GETTER: typing.Final = _FIELDS_GETTER
+# Fields that can be changed through _async_update_entity, entity_id and
+# unique_id are renamed through their own arguments
+_UPDATE_FIELDS: typing.Final = frozenset(_FIELDS) - {"entity_id", "unique_id", "id"}
+_DISABLER_BY_VALUE: typing.Final = {
+    member.value: member for member in EntityRegistryEntryDisabler
+}
+_CATEGORY_BY_VALUE: typing.Final = {member.value: member for member in EntityCategory}
+
+
+def _entry_to_dict(entry: EntityRegistryEntry) -> dict[str, typing.Any]:
+    """Return the stored representation of an entry."""
+    return dict(zip(_SAVED_FIELDS, _SAVED_FIELDS_GETTER(entry)))
+
+
+def _evolve_entry(
+    old: EntityRegistryEntry, changes: dict[str, typing.Any]
+) -> EntityRegistryEntry:
+    """Create a copy of an entry with changes."""
+    values = _entry_to_dict(old)
+    values.update(changes)
+    return EntityRegistryEntry(**values)
 
 
 # pylint: disable=unused-variable
@@ -87,6 +110,11 @@ class EntityRegistry:
         self._entities = None
         self._shc = shc
         self._loaded = False
+        # Serialized rows of the last save, only dirty rows are rebuilt
+        self._dirty: set[str] = set()
+        self._snapshot: dict[str, dict[str, typing.Any]] = {}
+        self._batch_depth = 0
+        self._batch_save_pending = False
         self._store = EntityRegistryStore(
             shc,
             _STORAGE_VERSION_MAJOR,
@@ -180,12 +208,12 @@ class EntityRegistry:
     @callback
     def async_is_registered(self, entity_id: str) -> bool:
         """Check if an entity_id is currently registered."""
-        return entity_id in self._entities
+        return entity_id in self._entities.data
 
     @callback
     def async_get(self, entity_id: str) -> EntityRegistryEntry:
         """Get EntityEntry for an entity_id."""
-        return self._entities.get(entity_id)
+        return self._entities.data.get(entity_id)
 
     @callback
     def async_get_entity_id(self, domain: str, platform: str, unique_id: str) -> str:
@@ -203,20 +231,24 @@ class EntityRegistry:
 
         Conflicts checked against registered and currently existing entities.
         """
-        preferred_string = f"{domain}.{helpers.slugify(suggested_object_id)}"
-
         if len(domain) > Const.MAX_LENGTH_STATE_DOMAIN:
             raise MaxLengthExceeded(domain, "domain", Const.MAX_LENGTH_STATE_DOMAIN)
 
+        preferred_string = f"{domain}.{helpers.slugify(suggested_object_id)}"
         test_string = preferred_string[: Const.MAX_LENGTH_STATE_ENTITY_ID]
         if not known_object_ids:
-            known_object_ids = {}
+            known_object_ids = ()
+        elif not isinstance(known_object_ids, (set, frozenset, dict)):
+            # Callers may pass lists, make the probe below a hash lookup
+            known_object_ids = set(known_object_ids)
 
+        entities = self._entities.data
+        async_available = self._shc.states.async_available
         tries = 1
         while (
-            test_string in self._entities
+            test_string in entities
             or test_string in known_object_ids
-            or not self._shc.states.async_available(test_string)
+            or not async_available(test_string)
         ):
             tries += 1
             len_suffix = len(str(tries)) + 1
@@ -265,7 +297,17 @@ class EntityRegistry:
         entity_id = self.async_get_entity_id(domain, platform, unique_id)
 
         if entity_id:
-            return self.async_update_entity(
+            # When we changed our slugify algorithm, we invalidated some
+            # stored entity IDs with either a __ or ending in _.
+            # Fix introduced in 0.86 (Jan 23, 2019). Valid entity IDs are
+            # already slugified, so only slugify the invalid ones again.
+            if helpers.valid_entity_id(entity_id):
+                new_entity_id = _UNDEFINED
+            else:
+                new_entity_id = ".".join(
+                    helpers.slugify(part) for part in entity_id.split(".", 1)
+                )
+            return self._async_update_entity(
                 entity_id,
                 area_id=area_id,
                 capabilities=capabilities,
@@ -278,13 +320,7 @@ class EntityRegistry:
                 original_name=original_name,
                 supported_features=supported_features,
                 unit_of_measurement=unit_of_measurement,
-                # When we changed our slugify algorithm, we invalidated some
-                # stored entity IDs with either a __ or ending in _.
-                # Fix introduced in 0.86 (Jan 23, 2019). Next line can be
-                # removed when we release 1.0 or in 2020.
-                new_entity_id=".".join(
-                    helpers.slugify(part) for part in entity_id.split(".", 1)
-                ),
+                new_entity_id=new_entity_id,
             )
 
         entity_id = self.async_generate_entity_id(
@@ -309,30 +345,37 @@ class EntityRegistry:
         ):
             raise ValueError("entity_category must be a valid EntityCategory instance")
 
-        def none_if_undefined(value: _T | object) -> _T:
-            """Return None if value is UNDEFINED, otherwise return value."""
-            return None if value is _UNDEFINED else value
+        # Leave undefined fields to the defaults of EntityRegistryEntry
+        extras = {
+            name: value
+            for name, value in (
+                ("area_id", area_id),
+                ("capabilities", capabilities),
+                ("config_entry_id", config_entry_id),
+                ("device_id", device_id),
+                ("entity_category", entity_category),
+                ("original_device_class", original_device_class),
+                ("original_icon", original_icon),
+                ("original_name", original_name),
+                ("supported_features", supported_features),
+                ("unit_of_measurement", unit_of_measurement),
+            )
+            if value is not _UNDEFINED
+        }
+        if has_entity_name is not _UNDEFINED:
+            extras["has_entity_name"] = has_entity_name or False
 
         entry = EntityRegistryEntry(
-            area_id=none_if_undefined(area_id),
-            capabilities=none_if_undefined(capabilities),
-            config_entry_id=none_if_undefined(config_entry_id),
-            device_id=none_if_undefined(device_id),
-            disabled_by=disabled_by,
-            entity_category=none_if_undefined(entity_category),
-            has_entity_name=none_if_undefined(has_entity_name) or False,
             entity_id=entity_id,
-            hidden_by=hidden_by,
-            original_device_class=none_if_undefined(original_device_class),
-            original_icon=none_if_undefined(original_icon),
-            original_name=none_if_undefined(original_name),
             platform=platform,
-            supported_features=none_if_undefined(supported_features) or 0,
             unique_id=unique_id,
-            unit_of_measurement=none_if_undefined(unit_of_measurement),
+            disabled_by=disabled_by,
+            hidden_by=hidden_by,
+            **extras,
         )
         self._entities[entity_id] = entry
         _LOGGER.info(f"Registered new {domain}.{platform} entity: {entity_id}")
+        self._dirty.add(entity_id)
         self.async_schedule_save()
 
         self._shc.bus.async_fire(
@@ -350,6 +393,7 @@ class EntityRegistry:
             Const.EVENT_ENTITY_REGISTRY_UPDATED,
             {"action": "remove", "entity_id": entity_id},
         )
+        self._dirty.add(entity_id)
         self.async_schedule_save()
 
     @callback
@@ -362,6 +406,12 @@ class EntityRegistry:
         Disable entities in the registry that are associated to a device when
         the device is disabled.
         """
+        with self._async_batch():
+            self._async_device_modified(event)
+
+    @callback
+    def _async_device_modified(self, event: Event) -> None:
+        """Apply a device registry change to the entities of the device."""
         if event.data["action"] == "remove":
             entities = self.async_entries_for_device(
                 event.data["device_id"], include_disabled_entities=True
@@ -422,29 +472,20 @@ class EntityRegistry:
         self,
         entity_id: str,
         *,
-        area_id: str | object = _UNDEFINED,
-        capabilities: collections.abc.Mapping[str, typing.Any] | object = _UNDEFINED,
-        config_entry_id: str | object = _UNDEFINED,
-        device_class: str | object = _UNDEFINED,
-        device_id: str | object = _UNDEFINED,
-        disabled_by: EntityRegistryEntryDisabler | object = _UNDEFINED,
-        entity_category: EntityCategory | object = _UNDEFINED,
-        has_entity_name: bool | object = _UNDEFINED,
-        hidden_by: EntityRegistryEntryHider | object = _UNDEFINED,
-        icon: str | object = _UNDEFINED,
-        name: str | object = _UNDEFINED,
         new_entity_id: str | object = _UNDEFINED,
         new_unique_id: str | object = _UNDEFINED,
-        original_device_class: str | object = _UNDEFINED,
-        original_icon: str | object = _UNDEFINED,
-        original_name: str | object = _UNDEFINED,
-        supported_features: int | object = _UNDEFINED,
-        unit_of_measurement: str | object = _UNDEFINED,
-        platform: str | object = _UNDEFINED,
-        options: collections.abc.Mapping[str, collections.abc.Mapping[str, typing.Any]]
-        | object = _UNDEFINED,
+        **changes: typing.Any,
     ) -> EntityRegistryEntry:
-        """Private facing update properties method."""
+        """Private facing update properties method.
+
+        changes maps names from _UPDATE_FIELDS to new values, _UNDEFINED values
+        are ignored.
+        """
+        if unknown := changes.keys() - _UPDATE_FIELDS:
+            raise TypeError(
+                f"Unexpected keyword arguments: {', '.join(sorted(unknown))}"
+            )
+
         old = self._entities[entity_id]
 
         # Dict with new key/value pairs
@@ -453,42 +494,25 @@ class EntityRegistry:
         old_values: dict[str, typing.Any] = {}
 
         if (
-            disabled_by
+            (disabled_by := changes.get("disabled_by"))
             and disabled_by is not _UNDEFINED
             and not isinstance(disabled_by, EntityRegistryEntryDisabler)
         ):
             raise ValueError("disabled_by must be a RegistryEntryDisabler value")
 
         if (
-            entity_category
+            (entity_category := changes.get("entity_category"))
             and entity_category is not _UNDEFINED
             and not isinstance(entity_category, EntityCategory)
         ):
             raise ValueError("entity_category must be a valid EntityCategory instance")
 
-        for attr_name, value in (
-            ("area_id", area_id),
-            ("capabilities", capabilities),
-            ("config_entry_id", config_entry_id),
-            ("device_class", device_class),
-            ("device_id", device_id),
-            ("disabled_by", disabled_by),
-            ("entity_category", entity_category),
-            ("has_entity_name", has_entity_name),
-            ("hidden_by", hidden_by),
-            ("icon", icon),
-            ("name", name),
-            ("original_device_class", original_device_class),
-            ("original_icon", original_icon),
-            ("original_name", original_name),
-            ("supported_features", supported_features),
-            ("unit_of_measurement", unit_of_measurement),
-            ("platform", platform),
-            ("options", options),
-        ):
-            if value is not _UNDEFINED and value != getattr(old, attr_name):
+        for attr_name, value in changes.items():
+            if value is _UNDEFINED:
+                continue
+            if value != (old_value := getattr(old, attr_name)):
                 new_values[attr_name] = value
-                old_values[attr_name] = getattr(old, attr_name)
+                old_values[attr_name] = old_value
 
         if new_entity_id is not _UNDEFINED and new_entity_id != old.entity_id:
             if self.async_is_registered(new_entity_id):
@@ -497,10 +521,7 @@ class EntityRegistry:
             if not helpers.valid_entity_id(new_entity_id):
                 raise ValueError("Invalid entity ID")
 
-            if (
-                helpers.split_entity_id(new_entity_id)[0]
-                != helpers.split_entity_id(entity_id)[0]
-            ):
+            if helpers.split_entity_id(new_entity_id)[0] != old.domain:
                 raise ValueError("New entity ID should be same domain")
 
             self._entities.pop(entity_id)
@@ -522,8 +543,10 @@ class EntityRegistry:
         if not new_values:
             return old
 
-        new = self._entities[entity_id] = attr.evolve(old, **new_values)
+        new = self._entities[entity_id] = _evolve_entry(old, new_values)
 
+        self._dirty.add(entity_id)
+        self._dirty.add(old.entity_id)
         self.async_schedule_save()
 
         data: dict[str, str | dict[str, typing.Any]] = {
@@ -541,50 +564,20 @@ class EntityRegistry:
 
     @callback
     def async_update_entity(
-        self,
-        entity_id: str,
-        *,
-        area_id: str | object = _UNDEFINED,
-        capabilities: collections.abc.Mapping[str, typing.Any] | object = _UNDEFINED,
-        config_entry_id: str | object = _UNDEFINED,
-        device_class: str | object = _UNDEFINED,
-        device_id: str | object = _UNDEFINED,
-        disabled_by: EntityRegistryEntryDisabler | object = _UNDEFINED,
-        entity_category: EntityCategory | object = _UNDEFINED,
-        has_entity_name: bool | object = _UNDEFINED,
-        hidden_by: EntityRegistryEntryHider | object = _UNDEFINED,
-        icon: str | object = _UNDEFINED,
-        name: str | object = _UNDEFINED,
-        new_entity_id: str | object = _UNDEFINED,
-        new_unique_id: str | object = _UNDEFINED,
-        original_device_class: str | object = _UNDEFINED,
-        original_icon: str | object = _UNDEFINED,
-        original_name: str | object = _UNDEFINED,
-        supported_features: int | object = _UNDEFINED,
-        unit_of_measurement: str | object = _UNDEFINED,
+        self, entity_id: str, **kwargs: typing.Any
     ) -> EntityRegistryEntry:
-        """Update properties of an entity."""
-        return self._async_update_entity(
-            entity_id,
-            area_id=area_id,
-            capabilities=capabilities,
-            config_entry_id=config_entry_id,
-            device_class=device_class,
-            device_id=device_id,
-            disabled_by=disabled_by,
-            entity_category=entity_category,
-            has_entity_name=has_entity_name,
-            hidden_by=hidden_by,
-            icon=icon,
-            name=name,
-            new_entity_id=new_entity_id,
-            new_unique_id=new_unique_id,
-            original_device_class=original_device_class,
-            original_icon=original_icon,
-            original_name=original_name,
-            supported_features=supported_features,
-            unit_of_measurement=unit_of_measurement,
-        )
+        """Update properties of an entity.
+
+        Takes the keyword arguments of _async_update_entity, except platform
+        and options, which are changed through async_update_entity_platform
+        and async_update_entity_options.
+        """
+        if "platform" in kwargs or "options" in kwargs:
+            raise TypeError(
+                "async_update_entity() got an unexpected keyword argument "
+                + ("'platform'" if "platform" in kwargs else "'options'")
+            )
+        return self._async_update_entity(entity_id, **kwargs)
 
     @callback
     def async_update_entity_platform(
@@ -667,11 +660,11 @@ class EntityRegistry:
                     config_entry_id=entity["config_entry_id"],
                     device_class=entity["device_class"],
                     device_id=entity["device_id"],
-                    disabled_by=EntityRegistryEntryDisabler(entity["disabled_by"])
-                    if entity["disabled_by"]
+                    disabled_by=_DISABLER_BY_VALUE[disabled_by]
+                    if (disabled_by := entity["disabled_by"])
                     else None,
-                    entity_category=EntityCategory(entity["entity_category"])
-                    if entity["entity_category"]
+                    entity_category=_CATEGORY_BY_VALUE[entity_category]
+                    if (entity_category := entity["entity_category"])
                     else None,
                     entity_id=entity["entity_id"],
                     hidden_by=entity["hidden_by"],
@@ -690,61 +683,63 @@ class EntityRegistry:
                 )
 
         self._entities = entities
+        self._snapshot = {}
+        self._dirty.clear()
 
     @callback
     def async_schedule_save(self) -> None:
         """Schedule saving the entity registry."""
+        if self._batch_depth:
+            self._batch_save_pending = True
+            return
         self._store.async_delay_save(self._data_to_save, _SAVE_DELAY)
 
+    @contextlib.contextmanager
+    def _async_batch(self) -> collections.abc.Iterator[None]:
+        """Schedule a single save for all mutations done inside the block."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_save_pending:
+                self._batch_save_pending = False
+                self.async_schedule_save()
+
     @callback
     def _data_to_save(self) -> dict[str, typing.Any]:
         """Return data of entity registry to store in a file."""
         data: dict[str, typing.Any] = {}
+        snapshot = self._snapshot
+        entities = self._entities.data
 
-        data["entities"] = [
-            {
-                "area_id": entry.area_id,
-                "capabilities": entry.capabilities,
-                "config_entry_id": entry.config_entry_id,
-                "device_class": entry.device_class,
-                "device_id": entry.device_id,
-                "disabled_by": entry.disabled_by,
-                "entity_category": entry.entity_category,
-                "entity_id": entry.entity_id,
-                "hidden_by": entry.hidden_by,
-                "icon": entry.icon,
-                "id": entry.id,
-                "has_entity_name": entry.has_entity_name,
-                "name": entry.name,
-                "options": entry.options,
-                "original_device_class": entry.original_device_class,
-                "original_icon": entry.original_icon,
-                "original_name": entry.original_name,
-                "platform": entry.platform,
-                "supported_features": entry.supported_features,
-                "unique_id": entry.unique_id,
-                "unit_of_measurement": entry.unit_of_measurement,
-            }
-            for entry in self._entities.values()
-        ]
+        if not snapshot:
+            snapshot.update(zip(entities, map(_entry_to_dict, entities.values())))
+        else:
+            for entity_id in self._dirty:
+                if (entry := entities.get(entity_id)) is None:
+                    snapshot.pop(entity_id, None)
+                else:
+                    snapshot[entity_id] = _entry_to_dict(entry)
+        self._dirty.clear()
+
+        data["entities"] = list(snapshot.values())
 
         return data
 
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self._entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
-            self.async_remove(entity_id)
+        entity_ids = self._entities.get_entries_for_config_entry(config_entry)
+        with self._async_batch():
+            for entity_id in list(entity_ids):
+                self.async_remove(entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self._entities.items():
-            if area_id == entry.area_id:
+        with self._async_batch():
+            for entity_id in list(self._entities.get_entries_for_area(area_id)):
                 self.async_update_entity(entity_id, area_id=None)
 
     @callback
@@ -752,11 +747,12 @@ class EntityRegistry:
         self, device_id: str, include_disabled_entities: bool = False
     ) -> list[EntityRegistryEntry]:
         """Return entries that match a device."""
+        entities = self._entities
         return [
             entry
-            for entry in self._entities.values()
-            if entry.device_id == device_id
-            and (not entry.disabled_by or include_disabled_entities)
+            for entity_id in entities.get_entries_for_device(device_id)
+            if not (entry := entities[entity_id]).disabled
+            or include_disabled_entities
         ]
 
     @callback
@@ -792,10 +788,12 @@ class EntityRegistry:
         @callback
         def _write_unavailable_states(_: Event) -> None:
             """Make sure state machine contains entry for each registered entity."""
-            existing = set(self._shc.states.async_entity_ids())
+            entities = self._entities.data
+            missing = entities.keys() - self._shc.states.async_entity_ids()
 
-            for entry in self._entities.values():
-                if entry.entity_id in existing or entry.disabled:
+            for entity_id in missing:
+                entry = entities[entity_id]
+                if entry.disabled:
                     continue
 
                 entry.write_unavailable_state(self._shc)
@@ -817,17 +815,20 @@ class EntityRegistry:
     @callback
     def async_entries_for_area(self, area_id: str) -> list[EntityRegistryEntry]:
         """Return entries that match an area."""
-        return [entry for entry in self._entities.values() if entry.area_id == area_id]
+        entities = self._entities
+        return [
+            entities[entity_id] for entity_id in entities.get_entries_for_area(area_id)
+        ]
 
     @callback
     def async_entries_for_config_entry(
         self, config_entry_id: str
     ) -> list[EntityRegistryEntry]:
         """Return entries that match a config entry."""
+        entities = self._entities
         return [
-            entry
-            for entry in self._entities.values()
-            if entry.config_entry_id == config_entry_id
+            entities[entity_id]
+            for entity_id in entities.get_entries_for_config_entry(config_entry_id)
         ]
 
     @callback
@@ -839,7 +840,14 @@ class EntityRegistry:
         with a config entry when the config entry is enabled and the entities are marked
         DISABLED_CONFIG_ENTRY.
         """
+        with self._async_batch():
+            self._async_config_entry_disabled_by_changed(config_entry)
 
+    @callback
+    def _async_config_entry_disabled_by_changed(
+        self, config_entry: ConfigEntry
+    ) -> None:
+        """Apply a config entry's disabled_by to its entities."""
         entities = self.async_entries_for_config_entry(config_entry.entry_id)
 
         if not config_entry.disabled_by:
@@ -864,11 +872,13 @@ class EntityRegistry:
         Raises vol.Invalid if the entity or UUID is invalid, or if the UUID is not
         associated with an entity registry item.
         """
-        if helpers.valid_entity_id(entity_id_or_uuid):
-            return entity_id_or_uuid
-        if (entry := self._entities.get_entry(entity_id_or_uuid)) is None:
-            raise vol.Invalid(f"Unknown entity registry entry {entity_id_or_uuid}")
-        return entry.entity_id
+        # Registry ids are plain hex strings, only entity ids contain a dot
+        if "." in entity_id_or_uuid:
+            if helpers.valid_entity_id(entity_id_or_uuid):
+                return entity_id_or_uuid
+        elif (entry := self._entities.get_entry(entity_id_or_uuid)) is not None:
+            return entry.entity_id
+        raise vol.Invalid(f"Unknown entity registry entry {entity_id_or_uuid}")
 
     @callback
     def async_resolve_entity_id(self, entity_id_or_uuid: str) -> str:
@@ -877,22 +887,25 @@ class EntityRegistry:
         Returns None if the entity or UUID is invalid, or if the UUID is not
         associated with an entity registry item.
         """
-        if helpers.valid_entity_id(entity_id_or_uuid):
-            return entity_id_or_uuid
+        if "." in entity_id_or_uuid:
+            if helpers.valid_entity_id(entity_id_or_uuid):
+                return entity_id_or_uuid
+            return None
         if (entry := self._entities.get_entry(entity_id_or_uuid)) is None:
             return None
         return entry.entity_id
 
     @callback
-    def async_validate_entity_ids(self, entity_ids_or_uuids: list[str]) -> list[str]:
+    def async_validate_entity_ids(
+        self, entity_ids_or_uuids: collections.abc.Iterable[str]
+    ) -> list[str]:
         """Validate and resolve a list of entity ids or UUIDs to a list of entity ids.
 
         Returns a list with UUID resolved to entity_ids.
         Raises vol.Invalid if any item is invalid, or if any a UUID is not associated with
         an entity registry item.
         """
-
-        return [self.async_validate_entity_id(item) for item in entity_ids_or_uuids]
+        return list(map(self.async_validate_entity_id, entity_ids_or_uuids))
 
     async def async_migrate_entries(
         self,
@@ -900,11 +913,10 @@ class EntityRegistry:
         entry_callback: typing.Callable[[EntityRegistryEntry], dict[str, typing.Any]],
     ) -> None:
         """Migrator of unique IDs."""
-        for entry in self._entities.values():
-            if entry.config_entry_id != config_entry_id:
-                continue
-
-            updates = entry_callback(entry)
+        update_entity = self.async_update_entity
+        with self._async_batch():
+            for entry in self.async_entries_for_config_entry(config_entry_id):
+                updates = entry_callback(entry)
 
-            if updates is not None:
-                self.async_update_entity(entry.entity_id, **updates)
+                if updates is not None:
+                    update_entity(entry.entity_id, **updates)
@@ -23,10 +23,10 @@ http://www.gnu.org/licenses/.
 """
 
 import collections.abc
+import operator
+import sys
 import typing
 
-import attr
-
 from . import helpers
 from .callback import callback
 from .const import Const
@@ -45,59 +45,129 @@ if typing.TYPE_CHECKING:
     from .smart_home_controller import SmartHomeController
 
 
+_FIELDS: typing.Final = (
+    "entity_id",
+    "unique_id",
+    "platform",
+    "area_id",
+    "capabilities",
+    "config_entry_id",
+    "device_class",
+    "device_id",
+    "disabled_by",
+    "entity_category",
+    "hidden_by",
+    "icon",
+    "id",
+    "has_entity_name",
+    "name",
+    "options",
+    "original_device_class",
+    "original_icon",
+    "original_name",
+    "supported_features",
+    "unit_of_measurement",
+)
+_FIELDS_GETTER: typing.Final = operator.attrgetter(*_FIELDS)
+
+
 # pylint: disable=unused-variable
-@attr.s(slots=True, frozen=True)
 class EntityRegistryEntry:
-    """Entity Registry Entry."""
-
-    entity_id: str = attr.ib()
-    unique_id: str = attr.ib()
-    platform: str = attr.ib()
-    area_id: str = attr.ib(default=None)
-    capabilities: collections.abc.Mapping[str, typing.Any] = attr.ib(default=None)
-    config_entry_id: str = attr.ib(default=None)
-    device_class: str = attr.ib(default=None)
-    device_id: str = attr.ib(default=None)
-    domain: str = attr.ib(init=False, repr=False)
-    disabled_by: EntityRegistryEntryDisabler = attr.ib(default=None)
-    entity_category: EntityCategory = attr.ib(default=None)
-    hidden_by: EntityRegistryEntryHider = attr.ib(default=None)
-    icon: str = attr.ib(default=None)
-    id: str = attr.ib(factory=helpers.random_uuid_hex)
-    has_entity_name: bool = attr.ib(default=False)
-    name: str = attr.ib(default=None)
-    options: collections.abc.Mapping[
-        str, collections.abc.Mapping[str, typing.Any]
-    ] = attr.ib(default=None, converter=attr.converters.default_if_none(factory=dict))
-    # As set by integration
-    original_device_class: str = attr.ib(default=None)
-    original_icon: str = attr.ib(default=None)
-    original_name: str = attr.ib(default=None)
-    supported_features: int = attr.ib(default=0)
-    unit_of_measurement: str = attr.ib(default=None)
-
-    @domain.default
-    def _domain_default(self) -> str:
-        """Compute domain value."""
-        return helpers.split_entity_id(self.entity_id)[0]
-
-    @property
-    def disabled(self) -> bool:
-        """Return if entry is disabled."""
-        return self.disabled_by is not None
-
-    @property
-    def hidden(self) -> bool:
-        """Return if entry is hidden."""
-        return self.hidden_by is not None
+    """Entity Registry Entry.
+
+    Entries are immutable, the entity registry replaces them on every update.
+    """
+
+    __slots__ = _FIELDS + ("domain", "disabled", "hidden", "_frozen")
+
+    def __init__(
+        self,
+        entity_id: str,
+        unique_id: str,
+        platform: str,
+        *,
+        area_id: str = None,
+        capabilities: collections.abc.Mapping[str, typing.Any] = None,
+        config_entry_id: str = None,
+        device_class: str = None,
+        device_id: str = None,
+        disabled_by: EntityRegistryEntryDisabler = None,
+        entity_category: EntityCategory = None,
+        hidden_by: EntityRegistryEntryHider = None,
+        icon: str = None,
+        id: str = None,  # pylint: disable=redefined-builtin
+        has_entity_name: bool = False,
+        name: str = None,
+        options: collections.abc.Mapping[
+            str, collections.abc.Mapping[str, typing.Any]
+        ] = None,
+        # As set by integration
+        original_device_class: str = None,
+        original_icon: str = None,
+        original_name: str = None,
+        supported_features: int = 0,
+        unit_of_measurement: str = None,
+    ) -> None:
+        """Initialize a registry entry."""
+        setattr_ = object.__setattr__
+        setattr_(self, "entity_id", entity_id)
+        setattr_(self, "unique_id", unique_id)
+        setattr_(self, "platform", helpers.intern_str(platform))
+        setattr_(self, "area_id", area_id)
+        setattr_(self, "capabilities", capabilities)
+        setattr_(self, "config_entry_id", helpers.intern_str(config_entry_id))
+        setattr_(self, "device_class", helpers.intern_str(device_class))
+        setattr_(self, "device_id", helpers.intern_str(device_id))
+        setattr_(self, "domain", sys.intern(entity_id.partition(".")[0]))
+        setattr_(self, "disabled_by", disabled_by)
+        setattr_(self, "disabled", disabled_by is not None)
+        setattr_(self, "entity_category", entity_category)
+        setattr_(self, "hidden_by", hidden_by)
+        setattr_(self, "hidden", hidden_by is not None)
+        setattr_(self, "icon", icon)
+        setattr_(self, "id", id if id is not None else helpers.random_uuid_hex())
+        setattr_(self, "has_entity_name", has_entity_name)
+        setattr_(self, "name", name)
+        setattr_(self, "options", options if options is not None else {})
+        setattr_(
+            self, "original_device_class", helpers.intern_str(original_device_class)
+        )
+        setattr_(self, "original_icon", helpers.intern_str(original_icon))
+        setattr_(self, "original_name", original_name)
+        setattr_(self, "supported_features", supported_features)
+        setattr_(self, "unit_of_measurement", helpers.intern_str(unit_of_measurement))
+        setattr_(self, "_frozen", True)
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        """Reject changes, the registry indexes rely on entries never changing."""
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"EntityRegistryEntry is immutable, can't set {name}")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        """Reject deleting attributes of an entry."""
+        raise AttributeError(f"EntityRegistryEntry is immutable, can't delete {name}")
+
+    def __eq__(self, other: typing.Any) -> bool:
+        """Compare two entries field by field."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return _FIELDS_GETTER(self) == _FIELDS_GETTER(other)
+
+    def __repr__(self) -> str:
+        """Return the representation of the entry."""
+        fields = ", ".join(
+            f"{name}={value!r}" for name, value in zip(_FIELDS, _FIELDS_GETTER(self))
+        )
+        return f"EntityRegistryEntry({fields})"
 
     @callback
     def write_unavailable_state(self, shc: SmartHomeController) -> None:
         """Write the unavailable state to the state machine."""
-        attrs: dict[str, typing.Any] = {Const.ATTR_RESTORED: True}
-
-        if self.capabilities is not None:
-            attrs.update(self.capabilities)
+        if (capabilities := self.capabilities) is not None:
+            attrs: dict[str, typing.Any] = {Const.ATTR_RESTORED: True, **capabilities}
+        else:
+            attrs = {Const.ATTR_RESTORED: True}
 
         device_class = self.device_class or self.original_device_class
         if device_class is not None:
@@ -111,8 +181,8 @@ class EntityRegistryEntry:
         if name is not None:
             attrs[Const.ATTR_FRIENDLY_NAME] = name
 
-        if self.supported_features is not None:
-            attrs[Const.ATTR_SUPPORTED_FEATURES] = self.supported_features
+        if supported_features := self.supported_features:
+            attrs[Const.ATTR_SUPPORTED_FEATURES] = supported_features
 
         if self.unit_of_measurement is not None:
             attrs[Const.ATTR_UNIT_OF_MEASUREMENT] = self.unit_of_measurement
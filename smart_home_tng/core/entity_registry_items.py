@@ -23,17 +23,28 @@ http://www.gnu.org/licenses/.
 """
 
 import collections
+import collections.abc
+import itertools
+import typing
 
 from .entity_registry_entry import EntityRegistryEntry
 
+_NOT_SET: typing.Final = object()
+
 
 # pylint: disable=unused-variable
 class EntityRegistryItems(collections.UserDict[str, "EntityRegistryEntry"]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains two additional indexes:
+    Maintains additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entry
+    - device_id -> {entity_id}
+    - config_entry_id -> {entity_id}
+    - area_id -> {entity_id}
+
+    The entity_id buckets keep registry insertion order, so lookups return
+    entries in the same order as a scan over all entries would.
     """
 
     def __init__(self) -> None:
@@ -41,23 +52,73 @@ class EntityRegistryItems(collections.UserDict[str, "EntityRegistryEntry"]):
         super().__init__()
         self._entry_ids: dict[str, EntityRegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_index: dict[str, dict[str, None]] = {}
+        self._by_config_entry: dict[str, dict[str, None]] = {}
+        self._by_area: dict[str, dict[str, None]] = {}
+        self._order: dict[str, int] = {}
+        self._counter = itertools.count()
 
     def __setitem__(self, key: str, entry: EntityRegistryEntry) -> None:
         """Add an item."""
-        if key in self:
-            old_entry = self[key]
+        if (old_entry := self.data.get(key)) is not None:
             del self._entry_ids[old_entry.id]
             del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
+            old_device_id = old_entry.device_id
+            old_config_entry_id = old_entry.config_entry_id
+            old_area_id = old_entry.area_id
+        else:
+            self._order[key] = next(self._counter)
+            old_device_id = old_config_entry_id = old_area_id = None
         super().__setitem__(key, entry)
         self._entry_ids.__setitem__(entry.id, entry)
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        self._move(self._device_index, old_device_id, entry.device_id, key)
+        self._move(
+            self._by_config_entry, old_config_entry_id, entry.config_entry_id, key
+        )
+        self._move(self._by_area, old_area_id, entry.area_id, key)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
-        entry = self[key]
+        self._remove(key)
+
+    def pop(self, key: str, default: typing.Any = _NOT_SET) -> EntityRegistryEntry:
+        """Remove an item and return it."""
+        if key not in self.data:
+            if default is _NOT_SET:
+                raise KeyError(key)
+            return default
+        return self._remove(key)
+
+    def _remove(self, key: str) -> EntityRegistryEntry:
+        """Remove an item and its index entries, return the removed entry."""
+        entry = self.data.pop(key)
         self._entry_ids.__delitem__(entry.id)
         self._index.__delitem__((entry.domain, entry.platform, entry.unique_id))
-        super().__delitem__(key)
+        _remove_from_index(self._device_index, entry.device_id, key)
+        _remove_from_index(self._by_config_entry, entry.config_entry_id, key)
+        _remove_from_index(self._by_area, entry.area_id, key)
+        del self._order[key]
+        return entry
+
+    def _move(
+        self, index: dict[str, dict[str, None]], old_value: str, value: str, key: str
+    ) -> None:
+        """Move an entity_id from the bucket of old_value to the one of value."""
+        if old_value == value:
+            return
+        _remove_from_index(index, old_value, key)
+        if value is None:
+            return
+        if (bucket := index.get(value)) is None:
+            index[value] = {key: None}
+            return
+        order = self._order
+        last_key = next(reversed(bucket))
+        bucket[key] = None
+        if order[key] < order[last_key]:
+            # An existing entry moved in, restore the registry order
+            index[value] = dict.fromkeys(sorted(bucket, key=order.__getitem__))
 
     def get_entity_id(self, key: tuple[str, str, str]) -> str:
         """Get entity_id from (domain, platform, unique_id)."""
@@ -66,3 +127,27 @@ class EntityRegistryItems(collections.UserDict[str, "EntityRegistryEntry"]):
     def get_entry(self, key: str) -> EntityRegistryEntry:
         """Get entry from id."""
         return self._entry_ids.get(key)
+
+    def get_entries_for_device(self, device_id: str) -> collections.abc.KeysView[str]:
+        """Get entity_ids of all entries linked to a device."""
+        return self._device_index.get(device_id, {}).keys()
+
+    def get_entries_for_config_entry(
+        self, config_entry_id: str
+    ) -> collections.abc.KeysView[str]:
+        """Get entity_ids of all entries linked to a config entry."""
+        return self._by_config_entry.get(config_entry_id, {}).keys()
+
+    def get_entries_for_area(self, area_id: str) -> collections.abc.KeysView[str]:
+        """Get entity_ids of all entries linked to an area."""
+        return self._by_area.get(area_id, {}).keys()
+
+
+def _remove_from_index(index: dict[str, dict[str, None]], value: str, key: str) -> None:
+    """Remove an entity_id from the bucket of value, dropping empty buckets."""
+    if value is None:
+        return
+    entity_ids = index[value]
+    entity_ids.pop(key, None)
+    if not entity_ids:
+        del index[value]
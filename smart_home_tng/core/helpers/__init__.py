@@ -38,8 +38,11 @@ from .config_validation import boolean, positive_int, string
 from .core import (
     async_generate_entity_id,
     convert,
+    convert_float,
+    convert_int,
     ensure_unique_string,
     get_random_string,
+    intern_str,
     raise_if_invalid_filename,
     raise_if_invalid_path,
     repr_helper,
@@ -28,6 +28,7 @@ import concurrent
 import functools
 import http.client
 import logging
+import sys
 import threading
 import time
 import traceback
@@ -139,28 +140,30 @@ def check_loop(
 
     found_frame = None
 
-    stack = traceback.extract_stack()
+    # Walk the live frames instead of extracting the whole stack, source lines
+    # are only read for the frame that gets reported.
+    caller = sys._getframe(1)  # pylint: disable=protected-access
 
     if (
         func.__name__ == "sleep"
-        and len(stack) >= 3
-        and stack[-3].filename.endswith("pydevd.py")
+        and caller.f_back is not None
+        and caller.f_back.f_code.co_filename.endswith("pydevd.py")
     ):
         # Don't report `time.sleep` injected by the debugger (pydevd.py)
-        # stack[-1] is us, stack[-2] is protected_loop_func, stack[-3] is the offender
+        # caller is protected_loop_func, caller.f_back is the offender
         return
 
-    for frame in reversed(stack):
+    frame = caller
+    while frame is not None:
+        filename = frame.f_code.co_filename
         for path in ("custom_components/", "smart_home_tng/components/"):
-            try:
-                index = frame.filename.index(path)
-                found_frame = frame
+            if (index := filename.find(path)) != -1:
+                found_frame = traceback.extract_stack(frame, limit=1)[0]
                 break
-            except ValueError:
-                continue
 
         if found_frame is not None:
             break
+        frame = frame.f_back
 
     # Did not source from integration? Hard error.
     if found_frame is None:
@@ -213,17 +216,55 @@ async def gather_with_concurrency(
 ) -> typing.Any:
     """Wrap asyncio.gather to limit the number of concurrent tasks.
 
-    From: https://stackoverflow.com/a/61478547/9127614
+    Runs at most `limit` workers that pull the awaitables from a shared
+    iterator, instead of wrapping every awaitable in a semaphore guarded task.
+    Results are returned in the order of `tasks`. Like gather, a failing
+    awaitable doesn't stop the others, the first error is raised once all
+    of them are done.
     """
-    semaphore = asyncio.Semaphore(limit)
+    if limit < 1:
+        _close_coroutines(tasks)
+        raise ValueError(f"Concurrency limit must be at least 1, got {limit}")
 
-    async def sem_task(task: collections.abc.Awaitable[typing.Any]) -> typing.Any:
-        async with semaphore:
-            return await task
+    results: list[typing.Any] = [None] * len(tasks)
+    errors: list[BaseException] = []
+    pending = iter(enumerate(tasks))
 
-    return await asyncio.gather(
-        *(sem_task(task) for task in tasks), return_exceptions=return_exceptions
-    )
+    async def worker() -> None:
+        for index, task in pending:
+            try:
+                results[index] = await task
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except BaseException as err:  # pylint: disable=broad-except
+                # Like gather, return the cancellation of a single awaitable,
+                # but let the cancellation of the whole gather through.
+                if isinstance(err, asyncio.CancelledError) and (
+                    asyncio.current_task().cancelling()
+                ):
+                    raise
+                if return_exceptions:
+                    results[index] = err
+                else:
+                    errors.append(err)
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(min(limit, len(tasks)))))
+    except asyncio.CancelledError:
+        # Nobody is going to await the awaitables not pulled so far
+        _close_coroutines(task for _, task in pending)
+        raise
+
+    if errors:
+        raise errors[0]
+    return results
+
+
+def _close_coroutines(awaitables: collections.abc.Iterable[typing.Any]) -> None:
+    """Close coroutines that will never be awaited."""
+    for awaitable in awaitables:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
 
 
 def shutdown_run_callback_threadsafe(loop: asyncio.events.AbstractEventLoop) -> None:
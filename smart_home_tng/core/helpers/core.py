@@ -26,8 +26,8 @@ import collections.abc
 import datetime
 import functools
 import random
-import re
 import string
+import sys
 import typing
 
 import slugify as unicode_slug
@@ -39,10 +39,12 @@ from . import dt
 _T = typing.TypeVar("_T")
 _U = typing.TypeVar("_U")
 
-_RE_SANITIZE_FILENAME: typing.Final = re.compile(r"(~|\.\.|/|\\)")
-_RE_SANITIZE_PATH: typing.Final = re.compile(r"(~|\.(\.)+)")
-_VALID_ENTITY_ID: typing.Final = re.compile(
-    r"^(?!.+__)(?!_)[\da-z_]+(?<!_)\.(?!_)[\da-z_]+(?<!_)$"
+_RANDOM_SOURCE: typing.Final = string.ascii_letters + string.digits
+_SYSRAND: typing.Final = random.SystemRandom()
+_UNSAFE_FILENAME_CHARS: typing.Final = frozenset("~/\\")
+# Deletes every character allowed in a slug, anything left over is invalid
+_SLUG_CHARS_TABLE: typing.Final = dict.fromkeys(
+    map(ord, string.ascii_lowercase + string.digits + "_")
 )
 
 if not typing.TYPE_CHECKING:
@@ -64,7 +66,7 @@ def raise_if_invalid_filename(filename: str) -> None:
 
     Raises a ValueError if the filename is invalid.
     """
-    if _RE_SANITIZE_FILENAME.sub("", filename) != filename:
+    if ".." in filename or not _UNSAFE_FILENAME_CHARS.isdisjoint(filename):
         raise ValueError(f"{filename} is not a safe filename")
 
 
@@ -74,7 +76,7 @@ def raise_if_invalid_path(path: str) -> None:
 
     Raises a ValueError if the path is invalid.
     """
-    if _RE_SANITIZE_PATH.sub("", path) != path:
+    if "~" in path or ".." in path:
         raise ValueError(f"{path} is not a safe path")
 
 
@@ -87,19 +89,49 @@ def convert(value: _T, to_type: typing.Callable[[_T], _U], default: _U = None) -
         return default
 
 
+def convert_float(value: typing.Any, default: float = None) -> float:
+    """Convert value to float, returns default if fails."""
+    try:
+        return default if value is None else float(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def convert_int(value: typing.Any, default: int = None) -> int:
+    """Convert value to int, returns default if fails."""
+    try:
+        return default if value is None else int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def intern_str(value: str) -> str:
+    """Intern a string that many objects share, pass anything else through."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
 def slugify(text: str, *, separator: str = "_") -> str:
     """Slugify a given text."""
     if text == "" or text is None:
         return ""
+    return _slugify(text, separator)
+
+
+@functools.lru_cache(maxsize=2048)
+def _slugify(text: str, separator: str) -> str:
+    """Slugify a non-empty text, cached as the same names recur."""
     slug = unicode_slug.slugify(text, separator=separator)
     return "unknown" if slug == "" else slug
 
 
 def repr_helper(inp: typing.Any) -> str:
     """Help creating a more readable string representation of objects."""
-    if isinstance(inp, collections.abc.Mapping):
+    # Plain dicts are by far the most common input, skip the ABC check for them
+    if isinstance(inp, (dict, collections.abc.Mapping)):
         return ", ".join(
-            f"{repr_helper(key)}={repr_helper(item)}" for key, item in inp.items()
+            [f"{repr_helper(key)}={repr_helper(item)}" for key, item in inp.items()]
         )
     if isinstance(inp, datetime.datetime):
         return dt.as_local(inp).isoformat()
@@ -116,13 +148,18 @@ def ensure_unique_string(
     If preferred string exists will append _2, _3, ..
     """
     test_string = preferred_string
-    current_strings_set = set(current_strings)
+    # Containers with hashed lookups can be probed directly, copy anything else
+    if isinstance(current_strings, (set, frozenset, dict, collections.abc.KeysView)):
+        current_strings_set = current_strings
+    else:
+        current_strings_set = set(current_strings)
 
+    prefix = preferred_string + "_"
     tries = 1
 
     while test_string in current_strings_set:
         tries += 1
-        test_string = f"{preferred_string}_{tries}"
+        test_string = prefix + str(tries)
 
     return test_string
 
@@ -130,10 +167,7 @@ def ensure_unique_string(
 # Taken from http://stackoverflow.com/a/23728630
 def get_random_string(length: int = 10) -> str:
     """Return a random string with letters and digits."""
-    generator = random.SystemRandom()
-    source_chars = string.ascii_letters + string.digits
-
-    return "".join(generator.choice(source_chars) for _ in range(length))
+    return "".join(_SYSRAND.choices(_RANDOM_SOURCE, k=length))
 
 
 @functools.lru_cache(Const.MAX_EXPECTED_ENTITY_IDS)
@@ -145,12 +179,25 @@ def split_entity_id(entity_id: str) -> tuple[str, str]:
     return domain, object_id
 
 
+@functools.lru_cache(Const.MAX_EXPECTED_ENTITY_IDS)
 def valid_entity_id(entity_id: str) -> bool:
     """Test if an entity ID is a valid format.
 
     Format: <domain>.<entity> where both are slugs.
     """
-    return _VALID_ENTITY_ID.match(entity_id) is not None
+    domain, dot, object_id = entity_id.partition(".")
+    return bool(dot) and _valid_slug(domain) and _valid_slug(object_id)
+
+
+def _valid_slug(part: str) -> bool:
+    """Test if part is a non-empty slug of [a-z0-9_] without stray underscores."""
+    return (
+        part != ""
+        and part[0] != "_"
+        and part[-1] != "_"
+        and "__" not in part
+        and part.translate(_SLUG_CHARS_TABLE) == ""
+    )
 
 
 @callback
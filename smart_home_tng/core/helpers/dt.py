@@ -22,9 +22,8 @@ License along with this program.  If not, see
 http://www.gnu.org/licenses/.
 """
 
-import bisect
-import contextlib
 import datetime
+import functools
 import re
 import typing
 import zoneinfo
@@ -33,6 +32,7 @@ import ciso8601
 
 _DATE_STR_FORMAT: typing.Final = "%Y-%m-%d"
 _UTC: typing.Final = datetime.timezone.utc
+_CISO_PARSE_DATETIME: typing.Final = ciso8601.parse_datetime
 
 # EPOCHORDINAL is not exposed as a constant
 # https://github.com/python/cpython/blob/3.10/Lib/zoneinfo/_zoneinfo.py#L12
@@ -77,6 +77,8 @@ _ISO8601_DURATION_RE: typing.Final = re.compile(
     + r"$"
 )
 
+_ISO8601_DURATION_PREFIXES: typing.Final = ("P", "+P", "-P")
+
 # Copyright (c) Django Software Foundation and individual contributors.
 # All rights reserved.
 # https://github.com/django/django/blob/master/LICENSE
@@ -114,6 +116,7 @@ def get_default_time_zone() -> datetime.timezone:
     return _TimeZoneSettings.default_time_zone
 
 
+@functools.lru_cache(maxsize=32)
 def get_time_zone(time_zone_str: str) -> datetime.tzinfo:
     """Get time zone from string. Return None if unable to determine.
 
@@ -140,7 +143,9 @@ def as_utc(dattim: datetime.datetime) -> datetime.datetime:
 
     Assumes datetime without tzinfo to be in the DEFAULT_TIME_ZONE.
     """
-    if dattim.tzinfo == _UTC:
+    # Aware datetimes created here share the tzinfo singletons, so an
+    # identity check suffices; other equal zones take the astimezone path.
+    if dattim.tzinfo is _UTC:
         return dattim
     if dattim.tzinfo is None:
         dattim = dattim.replace(tzinfo=_TimeZoneSettings.default_time_zone)
@@ -162,7 +167,7 @@ def as_timestamp(dt_value: datetime.datetime | str) -> float:
 
 def as_local(dattim: datetime.datetime) -> datetime.datetime:
     """Convert a UTC datetime object to local time zone."""
-    if dattim.tzinfo == _TimeZoneSettings.default_time_zone:
+    if dattim.tzinfo is _TimeZoneSettings.default_time_zone:
         return dattim
     if dattim.tzinfo is None:
         dattim = dattim.replace(tzinfo=_TimeZoneSettings.default_time_zone)
@@ -177,7 +182,10 @@ def utc_from_timestamp(timestamp: float) -> datetime.datetime:
 
 def utc_to_timestamp(utc_dt: datetime.datetime) -> float:
     """Fast conversion of a datetime in UTC to a timestamp."""
-    # Taken from
+    if utc_dt.tzinfo is not None:
+        # Aware datetimes take the C implementation
+        return utc_dt.timestamp()
+    # Naive datetimes are treated as UTC, taken from
     # https://github.com/python/cpython/blob/3.10/Lib/zoneinfo/_zoneinfo.py#L185
     return (
         (utc_dt.toordinal() - _EPOCHORDINAL) * 86400
@@ -199,8 +207,14 @@ def start_of_local_day(
     else:
         date = dt_or_d
 
+    return _start_of_local_day(date.toordinal(), _TimeZoneSettings.default_time_zone)
+
+
+@functools.lru_cache(maxsize=64)
+def _start_of_local_day(ordinal: int, time_zone: datetime.tzinfo) -> datetime.datetime:
+    """Return midnight of the day with the given ordinal in time_zone."""
     return datetime.datetime.combine(
-        date, datetime.time(), tzinfo=_TimeZoneSettings.default_time_zone
+        datetime.date.fromordinal(ordinal), datetime.time(), tzinfo=time_zone
     )
 
 
@@ -215,8 +229,10 @@ def parse_datetime(dt_str: str) -> datetime.datetime:
     Raises ValueError if the input is well formatted but not a valid datetime.
     Returns None if the input isn't well formatted.
     """
-    with contextlib.suppress(ValueError, IndexError):
-        return ciso8601.parse_datetime(dt_str)
+    try:
+        return _CISO_PARSE_DATETIME(dt_str)
+    except (ValueError, IndexError):
+        pass
 
     if not (match := _DATETIME_RE.match(dt_str)):
         return None
@@ -257,11 +273,13 @@ def parse_duration(value: str) -> datetime.timedelta:
     Also supports ISO 8601 representation and PostgreSQL's day-time interval
     format.
     """
-    match = (
-        _STANDARD_DURATION_RE.match(value)
-        or _ISO8601_DURATION_RE.match(value)
-        or _POSTGRES_INTERVAL_RE.match(value)
-    )
+    # Only ISO 8601 durations can start with "P", the other formats can't
+    if value.startswith(_ISO8601_DURATION_PREFIXES):
+        match = _ISO8601_DURATION_RE.match(value)
+    else:
+        match = _STANDARD_DURATION_RE.match(value) or _POSTGRES_INTERVAL_RE.match(
+            value
+        )
     if match:
         kws = match.groupdict()
         sign = -1 if kws.pop("sign", "+") == "-" else 1
@@ -362,14 +380,80 @@ def _dst_offset_diff(dattim: datetime.datetime) -> datetime.timedelta:
     return (dattim + delta).utcoffset() - (dattim - delta).utcoffset()
 
 
-def _lower_bound(arr: list[int], cmp: int) -> int:
-    """Return the first value in arr greater or equal to cmp.
+@functools.lru_cache(maxsize=128)
+def _successor_table(values: tuple[int, ...], modulus: int) -> tuple[int, ...]:
+    """Map every value below modulus to the first of values greater or equal.
 
-    Return None if no such value exists.
+    Entries without such a value are None, so the lookup replaces a bisect.
     """
-    if (left := bisect.bisect_left(arr, cmp)) == len(arr):
-        return None
-    return arr[left]
+    matches = set(values)
+    table: list[int] = [None] * modulus
+    successor = None
+    for value in range(modulus - 1, -1, -1):
+        if value in matches:
+            successor = value
+        table[value] = successor
+    return tuple(table)
+
+
+def _next_time_components(
+    seconds: tuple[int, ...],
+    minutes: tuple[int, ...],
+    hours: tuple[int, ...],
+    hour: int,
+    minute: int,
+    second: int,
+) -> tuple[int, int, int, int]:
+    """Find the next matching wall clock time at or after hour:minute:second.
+
+    Return the matching hour, minute and second and the number of days
+    rolled over. Works on plain integers, so the caller only needs to
+    build one datetime from the result. The time units are matched with
+    successor tables, whose first entry is also the first matching value.
+    """
+    days = 0
+
+    # Match next second
+    if (next_second := seconds[second]) is None:
+        # No second to match in this minute. Roll-over to next minute.
+        next_second = seconds[0]
+        minute += 1
+        if minute == 60:
+            minute = 0
+            hour += 1
+            if hour == 24:
+                hour = 0
+                days += 1
+    second = next_second
+
+    # Match next minute
+    next_minute = minutes[minute]
+    if next_minute != minute:
+        # We're in the next minute. Seconds needs to be reset.
+        second = seconds[0]
+
+    if next_minute is None:
+        # No minute to match in this hour. Roll-over to next hour.
+        next_minute = minutes[0]
+        hour += 1
+        if hour == 24:
+            hour = 0
+            days += 1
+    minute = next_minute
+
+    # Match next hour
+    next_hour = hours[hour]
+    if next_hour != hour:
+        # We're in the next hour. Seconds+minutes needs to be reset.
+        second = seconds[0]
+        minute = minutes[0]
+
+    if next_hour is None:
+        # No minute to match in this day. Roll-over to next day.
+        next_hour = hours[0]
+        days += 1
+
+    return next_hour, minute, second, days
 
 
 def find_next_time_expression_time(
@@ -390,43 +474,25 @@ def find_next_time_expression_time(
     if not seconds or not minutes or not hours:
         raise ValueError("Cannot find a next time: Time expression never matches!")
 
+    second_table = _successor_table(tuple(seconds), 60)
+    minute_table = _successor_table(tuple(minutes), 60)
+    hour_table = _successor_table(tuple(hours), 24)
+
     while True:
         # Reset microseconds and fold; fold (for ambiguous DST times) will be handled later
         result = dt_now.replace(microsecond=0, fold=0)
 
-        # Match next second
-        if (next_second := _lower_bound(seconds, result.second)) is None:
-            # No second to match in this minute. Roll-over to next minute.
-            next_second = seconds[0]
-            result += datetime.timedelta(minutes=1)
-
-        result = result.replace(second=next_second)
-
-        # Match next minute
-        next_minute = _lower_bound(minutes, result.minute)
-        if next_minute != result.minute:
-            # We're in the next minute. Seconds needs to be reset.
-            result = result.replace(second=seconds[0])
-
-        if next_minute is None:
-            # No minute to match in this hour. Roll-over to next hour.
-            next_minute = minutes[0]
-            result += datetime.timedelta(hours=1)
-
-        result = result.replace(minute=next_minute)
-
-        # Match next hour
-        next_hour = _lower_bound(hours, result.hour)
-        if next_hour != result.hour:
-            # We're in the next hour. Seconds+minutes needs to be reset.
-            result = result.replace(second=seconds[0], minute=minutes[0])
-
-        if next_hour is None:
-            # No minute to match in this day. Roll-over to next day.
-            next_hour = hours[0]
-            result += datetime.timedelta(days=1)
-
-        result = result.replace(hour=next_hour)
+        hour, minute, second, days = _next_time_components(
+            second_table,
+            minute_table,
+            hour_table,
+            result.hour,
+            result.minute,
+            result.second,
+        )
+        result = result.replace(hour=hour, minute=minute, second=second)
+        if days:
+            result += datetime.timedelta(days=days)
 
         if result.tzinfo in (None, _UTC):
             # Using UTC, no DST checking needed
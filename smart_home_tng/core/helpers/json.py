@@ -124,11 +124,14 @@ def find_paths_unserializable_data(
     while to_process:
         obj, obj_path = to_process.popleft()
 
-        try:
-            dump_func(obj)
-            continue
-        except (ValueError, TypeError):
-            pass
+        # Containers are descended into instead of dumped, their items are
+        # checked on their own so every node is dumped only once.
+        if not isinstance(obj, (dict, list)):
+            try:
+                dump_func(obj)
+                continue
+            except (ValueError, TypeError):
+                pass
 
         # We convert objects with as_dict to their dict values so we can find bad data inside it
         if hasattr(obj, "as_dict"):
@@ -22,8 +22,21 @@ License along with this program.  If not, see
 http://www.gnu.org/licenses/.
 """
 
+import base64
 import random
 import time
+import typing
+
+try:
+    import ulid_transform
+except ImportError:
+    ulid_transform = None
+
+_GETRANDBITS: typing.Final = random.getrandbits
+_TIME: typing.Final = time.time
+_CROCKFORD: typing.Final = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567", b"0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+)
 
 # pylint: disable=unused-variable
 
@@ -38,7 +51,10 @@ def ulid_hex() -> str:
 
     ulid.from_uuid(uuid.UUID(ulid_hex))
     """
-    return f"{int(time.time()*1000):012x}{random.getrandbits(80):020x}"
+    if ulid_transform is not None:
+        return ulid_transform.ulid_hex()
+    # pylint: disable-next=consider-using-f-string
+    return "%012x%020x" % (int(_TIME() * 1000), _GETRANDBITS(80))
 
 
 def ulid(timestamp: float = None) -> str:
@@ -58,41 +74,19 @@ def ulid(timestamp: float = None) -> str:
     import ulid
     ulid.parse(ulid_util.ulid())
     """
-    ulid_bytes = int((timestamp or time.time()) * 1000).to_bytes(
-        6, byteorder="big"
-    ) + int(random.getrandbits(80)).to_bytes(10, byteorder="big")
-
-    # This is base32 crockford encoding with the loop unrolled for performance
-    #
-    # This code is adapted from:
-    # https://github.com/ahawker/ulid/blob/06289583e9de4286b4d80b4ad000d137816502ca/ulid/base32.py#L102
-    #
-    enc = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+    if ulid_transform is not None:
+        if timestamp:
+            return ulid_transform.ulid_at_time(timestamp)
+        return ulid_transform.ulid_now()
+
+    value = (int((timestamp or _TIME()) * 1000) << 80) | _GETRANDBITS(80)
+
+    # This is base32 crockford encoding. Shifting the 128 bit value left by 30
+    # bits into 20 bytes lines it up with the 5 bit groups of standard base32,
+    # the first 26 characters then only need to be mapped to crockford's
+    # alphabet.
     return (
-        enc[(ulid_bytes[0] & 224) >> 5]
-        + enc[ulid_bytes[0] & 31]
-        + enc[(ulid_bytes[1] & 248) >> 3]
-        + enc[((ulid_bytes[1] & 7) << 2) | ((ulid_bytes[2] & 192) >> 6)]
-        + enc[((ulid_bytes[2] & 62) >> 1)]
-        + enc[((ulid_bytes[2] & 1) << 4) | ((ulid_bytes[3] & 240) >> 4)]
-        + enc[((ulid_bytes[3] & 15) << 1) | ((ulid_bytes[4] & 128) >> 7)]
-        + enc[(ulid_bytes[4] & 124) >> 2]
-        + enc[((ulid_bytes[4] & 3) << 3) | ((ulid_bytes[5] & 224) >> 5)]
-        + enc[ulid_bytes[5] & 31]
-        + enc[(ulid_bytes[6] & 248) >> 3]
-        + enc[((ulid_bytes[6] & 7) << 2) | ((ulid_bytes[7] & 192) >> 6)]
-        + enc[(ulid_bytes[7] & 62) >> 1]
-        + enc[((ulid_bytes[7] & 1) << 4) | ((ulid_bytes[8] & 240) >> 4)]
-        + enc[((ulid_bytes[8] & 15) << 1) | ((ulid_bytes[9] & 128) >> 7)]
-        + enc[(ulid_bytes[9] & 124) >> 2]
-        + enc[((ulid_bytes[9] & 3) << 3) | ((ulid_bytes[10] & 224) >> 5)]
-        + enc[ulid_bytes[10] & 31]
-        + enc[(ulid_bytes[11] & 248) >> 3]
-        + enc[((ulid_bytes[11] & 7) << 2) | ((ulid_bytes[12] & 192) >> 6)]
-        + enc[(ulid_bytes[12] & 62) >> 1]
-        + enc[((ulid_bytes[12] & 1) << 4) | ((ulid_bytes[13] & 240) >> 4)]
-        + enc[((ulid_bytes[13] & 15) << 1) | ((ulid_bytes[14] & 128) >> 7)]
-        + enc[(ulid_bytes[14] & 124) >> 2]
-        + enc[((ulid_bytes[14] & 3) << 3) | ((ulid_bytes[15] & 224) >> 5)]
-        + enc[ulid_bytes[15] & 31]
+        base64.b32encode((value << 30).to_bytes(20, byteorder="big"))[:26]
+        .translate(_CROCKFORD)
+        .decode("ascii")
     )
@@ -38,7 +38,7 @@ class JsonEncoder(json.JSONEncoder):
         """
         if isinstance(o, datetime.datetime):
             return o.isoformat()
-        if isinstance(o, set):
+        if isinstance(o, (set, frozenset)):
             return list(o)
         if hasattr(o, "as_dict"):
             return o.as_dict()
@@ -1295,14 +1295,11 @@ class SetupManager:
                 platform_config = [platform_config]
 
             item: ConfigType
-            platform: str
             for item in platform_config:
-                try:
-                    platform = item.get(Const.CONF_PLATFORM)
-                except AttributeError:
-                    platform = None
-
-                yield platform, item
+                if isinstance(item, dict):
+                    yield item.get(Const.CONF_PLATFORM), item
+                else:
+                    yield None, item
 
     @staticmethod
     def extract_domain_configs(
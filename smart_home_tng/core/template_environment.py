@@ -1108,8 +1108,8 @@ class TemplateEnvironment(sandbox.ImmutableSandboxedEnvironment):
             entities = args[1]
 
         else:
-            latitude = helpers.convert(args[0], float)
-            longitude = helpers.convert(args[1], float)
+            latitude = helpers.convert_float(args[0])
+            longitude = helpers.convert_float(args[1])
 
             if latitude is None or longitude is None:
                 _LOGGER.warning(
@@ -1158,8 +1158,8 @@ class TemplateEnvironment(sandbox.ImmutableSandboxedEnvironment):
                     return None
 
                 value_2 = to_process.pop(0)
-                latitude = helpers.convert(value, float)
-                longitude = helpers.convert(value_2, float)
+                latitude = helpers.convert_float(value)
+                longitude = helpers.convert_float(value_2)
 
                 if latitude is None or longitude is None:
                     _LOGGER.warning(
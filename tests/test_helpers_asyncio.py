@@ -0,0 +1,59 @@
+"""Tests for the asyncio helpers."""
+
+import asyncio
+
+import pytest
+
+from smart_home_tng.core.helpers.asyncio import gather_with_concurrency
+
+
+async def _record(ran: list[int], index: int, fail: bool = False) -> int:
+    await asyncio.sleep(0)
+    ran.append(index)
+    if fail:
+        raise ValueError(index)
+    return index
+
+
+def test_gather_with_concurrency_keeps_order() -> None:
+    """Test results come back in the order of the awaitables."""
+    ran: list[int] = []
+    results = asyncio.run(
+        gather_with_concurrency(2, *(_record(ran, index) for index in range(6)))
+    )
+    assert results == [0, 1, 2, 3, 4, 5]
+
+
+def test_gather_with_concurrency_runs_all_after_failure() -> None:
+    """Test a failing awaitable doesn't keep the others from running."""
+    ran: list[int] = []
+    with pytest.raises(ValueError):
+        asyncio.run(
+            gather_with_concurrency(
+                2, *(_record(ran, index, index == 0) for index in range(6))
+            )
+        )
+    assert sorted(ran) == [0, 1, 2, 3, 4, 5]
+
+
+def test_gather_with_concurrency_return_exceptions() -> None:
+    """Test errors are returned as results with return_exceptions."""
+    ran: list[int] = []
+    results = asyncio.run(
+        gather_with_concurrency(
+            2,
+            *(_record(ran, index, index == 1) for index in range(3)),
+            return_exceptions=True,
+        )
+    )
+    assert results[0] == 0
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 2
+
+
+def test_gather_with_concurrency_rejects_invalid_limit() -> None:
+    """Test a limit below 1 is rejected."""
+    ran: list[int] = []
+    with pytest.raises(ValueError):
+        asyncio.run(gather_with_concurrency(0, _record(ran, 0)))
+    assert not ran